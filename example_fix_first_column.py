@@ -8,6 +8,51 @@ where the first column is fractionally missing from OCR output.
 
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+
+# Imported once at module load; the examples just check for None instead
+# of re-importing and handling ImportError on every call
+try:
+    from process_scorecards_paddleocr3 import process_golf_scorecard_paddleocr3
+except ImportError:
+    process_golf_scorecard_paddleocr3 = None
+
+
+def _is_nonempty_file(image_path):
+    """True if image_path exists and is not zero bytes (one stat call)."""
+    try:
+        return os.stat(image_path).st_size > 0
+    except OSError:
+        return False
+
+
+def _process_scorecard_to_csv(img_path, output_dir='scorecard_output_fixed'):
+    """
+    Worker for example_batch_processing: OCR one scorecard and save the CSV.
+
+    Top-level so it is picklable for ProcessPoolExecutor; each worker
+    process builds its own PaddleOCR instance on first use.
+    """
+    if process_golf_scorecard_paddleocr3 is None:
+        return "❌ Error: process_scorecards_paddleocr3.py not found"
+
+    try:
+        df = process_golf_scorecard_paddleocr3(
+            str(img_path),
+            x_margin_left=10,         # Adjust based on your needs
+            row_threshold_factor=0.6  # Adjust based on your needs
+        )
+    except Exception as e:
+        return f"❌ Error: {e}"
+
+    if df is not None and len(df) > 0:
+        output_file = os.path.join(output_dir, f"{img_path.stem}.csv")
+        df.to_csv(output_file, index=False)
+        return f"✓ Saved: {output_file}"
+    return "⚠️  No data extracted"
+
 
 def example_basic():
     """Basic usage with default parameters"""
@@ -16,13 +61,15 @@ def example_basic():
     print("=" * 70)
     print()
     
+    if process_golf_scorecard_paddleocr3 is None:
+        print("ERROR: process_scorecards_paddleocr3.py not found")
+        return
+
     try:
-        from process_scorecards_paddleocr3 import process_golf_scorecard_paddleocr3
-        
         # This uses default parameters: x_margin_left=0, row_threshold_factor=0.6
         image_path = 'golfsc/example_scorecard.png'
         
-        if os.path.exists(image_path):
+        if _is_nonempty_file(image_path):
             df = process_golf_scorecard_paddleocr3(image_path)
             
             if df is not None:
@@ -34,9 +81,6 @@ def example_basic():
             print(f"Image not found: {image_path}")
             print("This is just an example. Replace with your actual image path.")
     
-    except ImportError:
-        print("ERROR: process_scorecards_paddleocr3.py not found in current directory")
-        print("Make sure you're running this from the correct directory.")
     except Exception as e:
         print(f"ERROR: {e}")
 
@@ -48,12 +92,14 @@ def example_fix_missing_first_column():
     print("=" * 70)
     print()
     
+    if process_golf_scorecard_paddleocr3 is None:
+        print("ERROR: process_scorecards_paddleocr3.py not found")
+        return
+
     try:
-        from process_scorecards_paddleocr3 import process_golf_scorecard_paddleocr3
-        
         image_path = 'golfsc/example_scorecard.png'
         
-        if os.path.exists(image_path):
+        if _is_nonempty_file(image_path):
             # Try with x_margin_left to exclude left edge artifacts
             print("Processing with x_margin_left=10...")
             df = process_golf_scorecard_paddleocr3(
@@ -72,8 +118,6 @@ def example_fix_missing_first_column():
             print(f"Image not found: {image_path}")
             print("Replace with your actual image path in the code.")
     
-    except ImportError:
-        print("ERROR: process_scorecards_paddleocr3.py not found")
     except Exception as e:
         print(f"ERROR: {e}")
 
@@ -85,12 +129,14 @@ def example_fix_row_alignment():
     print("=" * 70)
     print()
     
+    if process_golf_scorecard_paddleocr3 is None:
+        print("ERROR: process_scorecards_paddleocr3.py not found")
+        return
+
     try:
-        from process_scorecards_paddleocr3 import process_golf_scorecard_paddleocr3
-        
         image_path = 'golfsc/example_scorecard.png'
         
-        if os.path.exists(image_path):
+        if _is_nonempty_file(image_path):
             # Try with looser row grouping
             print("Processing with row_threshold_factor=0.7 (looser grouping)...")
             df = process_golf_scorecard_paddleocr3(
@@ -107,8 +153,6 @@ def example_fix_row_alignment():
         else:
             print(f"Image not found: {image_path}")
     
-    except ImportError:
-        print("ERROR: process_scorecards_paddleocr3.py not found")
     except Exception as e:
         print(f"ERROR: {e}")
 
@@ -120,12 +164,14 @@ def example_combined_fix():
     print("=" * 70)
     print()
     
+    if process_golf_scorecard_paddleocr3 is None:
+        print("ERROR: process_scorecards_paddleocr3.py not found")
+        return
+
     try:
-        from process_scorecards_paddleocr3 import process_golf_scorecard_paddleocr3
-        
         image_path = 'golfsc/example_scorecard.png'
         
-        if os.path.exists(image_path):
+        if _is_nonempty_file(image_path):
             print("Processing with both parameters adjusted...")
             df = process_golf_scorecard_paddleocr3(
                 image_path,
@@ -147,8 +193,6 @@ def example_combined_fix():
         else:
             print(f"Image not found: {image_path}")
     
-    except ImportError:
-        print("ERROR: process_scorecards_paddleocr3.py not found")
     except Exception as e:
         print(f"ERROR: {e}")
 
@@ -160,66 +204,70 @@ def example_batch_processing():
     print("=" * 70)
     print()
     
+    if process_golf_scorecard_paddleocr3 is None:
+        print("ERROR: process_scorecards_paddleocr3.py not found")
+        return
+
     try:
-        from process_scorecards_paddleocr3 import process_golf_scorecard_paddleocr3
-        import glob
-        from pathlib import Path
-        
         # Find all scorecard images
+        # os.scandir streams directory entries without the fnmatch pass
+        # glob does, which matters for large scorecard directories
         image_dir = 'golfsc'
-        image_files = glob.glob(os.path.join(image_dir, '*.png'))
+        try:
+            image_files = sorted(
+                Path(e.path) for e in os.scandir(image_dir)
+                if e.is_file() and e.name.endswith('.png')
+            )
+        except FileNotFoundError:
+            image_files = []
         
         if not image_files:
             print(f"No images found in '{image_dir}/' directory")
             print("Add your scorecard images to the 'golfsc' directory first.")
             return
         
-        print(f"Found {len(image_files)} scorecard images")
+        n_images = len(image_files)
+        print(f"Found {n_images} scorecard images")
         print()
         
         # Process each with custom parameters
         output_dir = 'scorecard_output_fixed'
         os.makedirs(output_dir, exist_ok=True)
         
-        for i, img_path in enumerate(image_files, 1):
-            print(f"[{i}/{len(image_files)}] Processing: {os.path.basename(img_path)}")
-            
-            try:
-                df = process_golf_scorecard_paddleocr3(
-                    img_path,
-                    x_margin_left=10,         # Adjust based on your needs
-                    row_threshold_factor=0.6  # Adjust based on your needs
-                )
-                
-                if df is not None and len(df) > 0:
-                    # Save to CSV
-                    output_file = os.path.join(
-                        output_dir,
-                        f"{Path(img_path).stem}.csv"
-                    )
-                    df.to_csv(output_file, index=False)
-                    print(f"  ✓ Saved: {output_file}")
-                else:
-                    print(f"  ⚠️  No data extracted")
-                    
-            except Exception as e:
-                print(f"  ❌ Error: {e}")
-            
-            print()
-        
+        # Scorecards are independent, so farm them out to one worker per
+        # core; each worker holds its own PaddleOCR instance
+        worker = partial(_process_scorecard_to_csv, output_dir=output_dir)
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+            results = zip(image_files, ex.map(worker, image_files))
+            for i, (img_path, status) in enumerate(results, 1):
+                print(f"[{i}/{n_images}] {img_path.name}: {status}")
+                print()
+
+
         print("=" * 70)
         print(f"Batch processing complete! Check '{output_dir}/' directory")
         print("=" * 70)
     
-    except ImportError:
-        print("ERROR: process_scorecards_paddleocr3.py not found")
     except Exception as e:
         print(f"ERROR: {e}")
 
 
 def main():
     """Run all examples"""
-    print("""
+    # Check if module is available
+    if process_golf_scorecard_paddleocr3 is None:
+        print("=" * 70)
+        print("ERROR: process_scorecards_paddleocr3.py not found!")
+        print("=" * 70)
+        print()
+        print("Make sure you have the file in the current directory.")
+        print("You can find it in the repository.")
+        sys.exit(1)
+
+    # Build the whole banner/usage text once and write it in a single call
+    # instead of ~30 separate print()s (one write syscall, one stdout lock)
+    bar = "=" * 70
+    sys.stdout.write(f"""
 ╔═══════════════════════════════════════════════════════════════════════╗
 ║       Examples: Fixing Missing First Column in OCR Results           ║
 ╚═══════════════════════════════════════════════════════════════════════╝
@@ -231,59 +279,37 @@ Parameters:
   • x_margin_left: Pixels to skip from left edge (try 10, 15, 20)
   • row_threshold_factor: Row grouping strictness (try 0.5 to 0.8)
 
-    """)
-    
-    # Check if module is available
-    try:
-        from process_scorecards_paddleocr3 import process_golf_scorecard_paddleocr3
-    except ImportError:
-        print("=" * 70)
-        print("ERROR: process_scorecards_paddleocr3.py not found!")
-        print("=" * 70)
-        print()
-        print("Make sure you have the file in the current directory.")
-        print("You can find it in the repository.")
-        sys.exit(1)
-    
-    # Run examples
-    print("\nRunning examples...\n")
-    
-    # Note: These examples won't actually process images unless
-    # you have scorecard images in the golfsc/ directory
-    
-    print("NOTE: These are code examples showing different parameter combinations.")
-    print("To actually run them, add your scorecard images to 'golfsc/' directory.")
-    print()
-    
-    # Show example usage patterns
-    print("=" * 70)
-    print("Usage Patterns")
-    print("=" * 70)
-    print()
-    
-    print("1. Default (no parameters):")
-    print("   df = process_golf_scorecard_paddleocr3('image.png')")
-    print()
-    
-    print("2. Fix missing first column:")
-    print("   df = process_golf_scorecard_paddleocr3('image.png', x_margin_left=10)")
-    print()
-    
-    print("3. Fix row alignment:")
-    print("   df = process_golf_scorecard_paddleocr3('image.png', row_threshold_factor=0.7)")
-    print()
-    
-    print("4. Combined fix:")
-    print("   df = process_golf_scorecard_paddleocr3('image.png', x_margin_left=10, row_threshold_factor=0.7)")
-    print()
-    
-    print("=" * 70)
-    print("To run actual processing:")
-    print("=" * 70)
-    print("1. Add your scorecard images to 'golfsc/' directory")
-    print("2. Run: python process_scorecards_paddleocr3.py")
-    print("3. Or use the examples in this file as templates")
-    print()
+
+
+Running examples...
+
+NOTE: These are code examples showing different parameter combinations.
+To actually run them, add your scorecard images to 'golfsc/' directory.
+
+{bar}
+Usage Patterns
+{bar}
+
+1. Default (no parameters):
+   df = process_golf_scorecard_paddleocr3('image.png')
+
+2. Fix missing first column:
+   df = process_golf_scorecard_paddleocr3('image.png', x_margin_left=10)
+
+3. Fix row alignment:
+   df = process_golf_scorecard_paddleocr3('image.png', row_threshold_factor=0.7)
+
+4. Combined fix:
+   df = process_golf_scorecard_paddleocr3('image.png', x_margin_left=10, row_threshold_factor=0.7)
+
+{bar}
+To run actual processing:
+{bar}
+1. Add your scorecard images to 'golfsc/' directory
+2. Run: python process_scorecards_paddleocr3.py
+3. Or use the examples in this file as templates
+
+""")
 
 
 if __name__ == "__main__":